@@ -1,4 +1,6 @@
 import os
+import threading
+
 import boto3
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
@@ -52,8 +54,10 @@ def get_dynamodb_client():
         # Use default credentials (IAM role, environment, or ~/.aws/credentials)
         return boto3.client('dynamodb', region_name=AWS_REGION)
 
-def get_dynamodb_resource():
-    """Get DynamoDB resource instance (higher-level API)"""
+# boto3 resources are not thread-safe, so each thread keeps its own
+_resource_cache = threading.local()
+
+def _new_dynamodb_resource():
     if AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY:
         return boto3.resource(
             'dynamodb',
@@ -65,6 +69,25 @@ def get_dynamodb_resource():
         # Use default credentials (IAM role, environment, or ~/.aws/credentials)
         return boto3.resource('dynamodb', region_name=AWS_REGION)
 
+def get_dynamodb_resource():
+    """
+    Get DynamoDB resource instance (higher-level API).
+
+    Cached per thread because boto3 resources are not thread-safe. Gunicorn's
+    sync workers (see Dockerfile) serve every request on one thread, so each
+    worker builds the resource once. The threaded dev server starts a new
+    thread per request and gets little reuse.
+    """
+    resource = getattr(_resource_cache, "resource", None)
+    if resource is None:
+        resource = _resource_cache.resource = _new_dynamodb_resource()
+    return resource
+
+def reset_dynamodb_resource():
+    """Drop the cached resources of every thread (e.g. after credentials change or in tests)."""
+    global _resource_cache
+    _resource_cache = threading.local()
+
 def create_tables_if_not_exist():
     """Create DynamoDB tables if they don't exist"""
     # Validate credentials before attempting to create tables
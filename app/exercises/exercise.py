@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.ndimage import gaussian_filter1d
@@ -22,7 +24,8 @@ POSE_PAIRS = [ ["Neck", "RShoulder"], ["Neck", "LShoulder"], ["RShoulder", "RElb
 # Presets of ALL exercises within scope
 # Plan to map correctly by using same exercise variable names in frontend that can be passed
 # to backend and then therefore used correctly in object instantiation
-EXERCISE_PRESETS = {
+# Read-only view so callers (and tests) can't add or replace presets at runtime
+EXERCISE_PRESETS = MappingProxyType({
     "iso_right_bicep_curl": {
         "name": "Bicep Curl",
         "isolated_movement": True,
@@ -103,7 +106,17 @@ EXERCISE_PRESETS = {
         "isolated_movement": False,
         "joint_group": ["RShoulder", "RElbow", "RWrist", "LShoulder", "LElbow", "LWrist"]
     }
-}
+})
+
+def _derive(positions, frame_size, dt):
+    """Normalize one axis of a joint's positions and return (position, velocity, acceleration)."""
+    normalized = positions / frame_size
+    # normalized = normalized - np.mean(normalized)
+    if len(normalized) >= 2 and dt > 0:
+        velocity = np.gradient(normalized, dt)
+        return normalized.tolist(), velocity, np.gradient(velocity, dt)
+    # Not enough samples to compute derivatives; keep arrays aligned.
+    return normalized.tolist(), np.zeros(len(normalized)), np.zeros(len(normalized))
 
 class Exercise:
     def __init__(self, name, joint_group, isolated_movement):
@@ -122,6 +135,28 @@ class Exercise:
 
         self.get_metrics()
 
+    def set_frame_values_array(self, xy, fps, frame_width, frame_height):
+        # xy is a (n_joints, n_frames, 2) array of pixel coordinates ordered like joint_group;
+        # skips the per-frame dict walk of set_frame_values
+        xy = np.asarray(xy, dtype=float)
+        if xy.ndim != 3 or xy.shape[2] != 2:
+            raise ValueError(f"xy must have shape (n_joints, n_frames, 2), got {xy.shape}")
+        if xy.shape[0] != len(self.joint_group):
+            raise ValueError(
+                f"xy has {xy.shape[0]} joints but joint_group has {len(self.joint_group)}"
+            )
+        self.frame_vals = None
+        self.frame_count = xy.shape[1]
+        self.fps = fps
+        self.frame_width = frame_width
+        self.frame_height = frame_height
+        self.x_metrics = {}
+        self.y_metrics = {}
+
+        dt = 1 / self.fps if self.fps else 0
+        for joint, positions in zip(self.joint_group, xy):
+            self._store_metrics(joint, positions, dt)
+
     def noise_reduction(self):
         pass
 
@@ -129,32 +164,17 @@ class Exercise:
         dt = 1 / self.fps if self.fps else 0
 
         for joint in self.frame_vals.keys():
-            x_positions = [val[0] for val in self.frame_vals[joint].values()]
-            # smoothed_x = gaussian_filter1d(x_positions, sigma=0.25)
-            normalized_x = [(x / self.frame_width) for x in x_positions]
-            # normalized_x = normalized_x - np.mean(normalized_x)
-            self.x_metrics[joint + " position"] = normalized_x
-            if len(normalized_x) >= 2 and dt > 0:
-                self.x_metrics[joint + " velocity"] = np.gradient(self.x_metrics[joint + " position"], dt)
-                self.x_metrics[joint + " acceleration"] = np.gradient(self.x_metrics[joint + " velocity"], dt)
-            else:
-                # Not enough samples to compute derivatives; keep arrays aligned.
-                self.x_metrics[joint + " velocity"] = np.zeros(len(normalized_x))
-                self.x_metrics[joint + " acceleration"] = np.zeros(len(normalized_x))
-
-
-            y_positions = [val[1] for val in self.frame_vals[joint].values()]
-            # smoothed_y = gaussian_filter1d(y_positions, sigma=0.25)
-            normalized_y = [(y / self.frame_height) for y in y_positions]
-            # normalized_y = normalized_y - np.mean(normalized_y)
-            self.y_metrics[joint + " position"] = normalized_y
-            if len(normalized_y) >= 2 and dt > 0:
-                self.y_metrics[joint + " velocity"] = np.gradient(self.y_metrics[joint + " position"], dt)
-                self.y_metrics[joint + " acceleration"] = np.gradient(self.y_metrics[joint + " velocity"], dt)
-            else:
-                # Not enough samples to compute derivatives; keep arrays aligned.
-                self.y_metrics[joint + " velocity"] = np.zeros(len(normalized_y))
-                self.y_metrics[joint + " acceleration"] = np.zeros(len(normalized_y))
+            positions = np.array(list(self.frame_vals[joint].values()), dtype=float).reshape(-1, 2)
+            # smoothed = gaussian_filter1d(positions, sigma=0.25, axis=0)
+            self._store_metrics(joint, positions, dt)
+
+    def _store_metrics(self, joint, positions, dt):
+        (self.x_metrics[joint + " position"],
+         self.x_metrics[joint + " velocity"],
+         self.x_metrics[joint + " acceleration"]) = _derive(positions[:, 0], self.frame_width, dt)
+        (self.y_metrics[joint + " position"],
+         self.y_metrics[joint + " velocity"],
+         self.y_metrics[joint + " acceleration"]) = _derive(positions[:, 1], self.frame_height, dt)
 
     def graph_metrics(self):
 
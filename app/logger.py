@@ -17,20 +17,30 @@ Usage:
     logger.error("Database connection failed")
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 
+def _enabled_from_env():
+    """Read the ENABLE_LOGGING switch from the environment."""
+    return os.getenv("ENABLE_LOGGING", "True").lower() == "true"
+
+
 # Configuration
-LOG_ENABLED = os.getenv("ENABLE_LOGGING", "True").lower() == "true"
+LOG_ENABLED = _enabled_from_env()
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_DIR = Path(__file__).parent.parent / "logs"
 LOG_FILE = LOG_DIR / "app.log"
 MAX_LOG_SIZE = 5 * 1024 * 1024  # 5MB
 BACKUP_COUNT = 5  # Keep 5 backup log files
 
+# Background listener that drains the root queue into the real handlers
+_listener = None
+
 
 class NullHandler(logging.Handler):
     """Handler that does nothing - used when logging is disabled."""
@@ -47,7 +57,13 @@ def setup_logging():
     - File handler with rotation for detailed logging
     - Timestamps in ISO format
     - Module names in all messages
+    
+    The root logger only gets a QueueHandler; a QueueListener thread
+    forwards records to the console and file handlers so callers never
+    block on stream or file I/O.
     """
+    global _listener
+    
     if not LOG_ENABLED:
         return
     
@@ -72,9 +88,10 @@ def setup_logging():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler with rotation (DEBUG level and above)
+    file_error = None
     try:
         file_handler = RotatingFileHandler(
             LOG_FILE,
@@ -83,15 +100,37 @@ def setup_logging():
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
     except Exception as e:
         # If file handler fails, log to console only
         console_handler.setLevel(logging.DEBUG)
+        file_error = e
+    
+    _stop_listener()
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    
+    if file_error is not None:
         root_logger.warning(
-            f"Could not set up file logging: {e}. Using console only."
+            f"Could not set up file logging: {file_error}. Using console only."
         )
 
 
+def _stop_listener():
+    """Flush and stop the queue listener, if one is running, and close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def get_logger(name):
     """
     Get a logger instance for a module.
@@ -120,6 +159,7 @@ def disable_logging():
     """Disable all logging output."""
     global LOG_ENABLED
     LOG_ENABLED = False
+    _stop_listener()
     root_logger = logging.getLogger()
     root_logger.handlers = []
     root_logger.addHandler(NullHandler())
@@ -146,6 +186,7 @@ def set_log_level(level):
     root_logger = logging.getLogger()
     root_logger.setLevel(level_value)
     
-    for handler in root_logger.handlers:
+    listener_handlers = _listener.handlers if _listener is not None else ()
+    for handler in (*root_logger.handlers, *listener_handlers):
         if not isinstance(handler, NullHandler):
             handler.setLevel(level_value)
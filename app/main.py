@@ -9,7 +9,7 @@ from app.profile_module.routes import profile_bp
 from app.auth_module.models import User  # Import User model so tables are created
 from app.chat_module.routes import chat_bp as chat_module_bp
 from app.fitness.benchmark_loader import load_fitness_benchmarks
-from app.logger import get_logger
+from app.logger import get_logger, setup_logging
 from app.exercises.routes import exercises_bp
 from app.exercises.models import VideoAsset  # noqa: F401
 from app.rate_limit import init_rate_limiter
@@ -31,7 +31,11 @@ else:
 
 # Configures Flask application (initializes with configuration settings,
 # sets up database, registers any blueprints)
-def create_app():
+def create_app(test_config=None):
+    if test_config is None:
+        # Start the queue-based console/file logging; tests pass test_config
+        # and keep pytest's own capture handlers on the root logger
+        setup_logging()
     app = Flask(__name__)
     app.config['SECRET_KEY'] = os.getenv("SECRET_KEY", "devkey")
     # Use instance folder for database
@@ -45,6 +49,9 @@ def create_app():
     app.config['SESSION_COOKIE_SECURE'] = _secure
     app.config['SESSION_COOKIE_HTTPONLY'] = True
     app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
+    # Tests override settings such as the database URI before the DB is bound
+    if test_config:
+        app.config.update(test_config)
 
     _default_origins = [
         "http://localhost:8081",
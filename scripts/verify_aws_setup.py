@@ -3,142 +3,210 @@
 Script to verify AWS DynamoDB setup
 Run this after configuring your .env file to check if everything is set up correctly
 """
+import argparse
+import functools
 import os
 import sys
 from pathlib import Path
 
+from dotenv import load_dotenv
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+env_path = project_root / '.env'
+_ENV_PATH_STR = str(env_path.resolve())
+
+REQUIRED_VARS = ('AWS_REGION', 'AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY')
+_SENSITIVE = frozenset(('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY'))
+OPTIONAL_VARS = {
+    'DYNAMODB_USER_PROFILES_TABLE': 'user_profiles',
+    'DYNAMODB_HEALTH_DATA_TABLE': 'health_data',
+}
+
+@functools.lru_cache(maxsize=1)
+def _ensure_env_loaded(path_str):
+    """Parse the .env file once; later calls for the same path are no-ops"""
+    return load_dotenv(dotenv_path=path_str)
+
+def _write(lines):
+    """Write a block of lines to stdout in one call and flush once"""
+    sys.stdout.writelines(f"{line}\n" for line in lines)
+    sys.stdout.flush()
 
 def check_env_file():
     """Check if .env file exists"""
-    env_path = project_root / '.env'
-    if not env_path.exists():
-        print("❌ .env file not found!")
-        print("   Create a .env file in the project root with your AWS credentials.")
+    try:
+        os.stat(_ENV_PATH_STR)
+    except FileNotFoundError:
+        _write([
+            "❌ .env file not found!",
+            "   Create a .env file in the project root with your AWS credentials.",
+        ])
         return False
-    print("✓ .env file found")
+    _ensure_env_loaded(_ENV_PATH_STR)
+    _write(["✓ .env file found"])
     return True
 
 def check_env_variables():
     """Check if required environment variables are set"""
-    from dotenv import load_dotenv
-    env_path = project_root / '.env'
-    load_dotenv(dotenv_path=env_path)
-    
-    required_vars = {
-        'AWS_REGION': os.getenv('AWS_REGION'),
-        'AWS_ACCESS_KEY_ID': os.getenv('AWS_ACCESS_KEY_ID'),
-        'AWS_SECRET_ACCESS_KEY': os.getenv('AWS_SECRET_ACCESS_KEY'),
-    }
+    _ensure_env_loaded(_ENV_PATH_STR)
     
-    optional_vars = {
-        'DYNAMODB_USER_PROFILES_TABLE': os.getenv('DYNAMODB_USER_PROFILES_TABLE', 'user_profiles'),
-        'DYNAMODB_HEALTH_DATA_TABLE': os.getenv('DYNAMODB_HEALTH_DATA_TABLE', 'health_data'),
-    }
+    env = dict(os.environ)
+    required_vars = {var: env.get(var) for var in REQUIRED_VARS}
+    optional_vars = {var: env.get(var, default) for var, default in OPTIONAL_VARS.items()}
     
     all_good = True
-    print("\nRequired Environment Variables:")
+    lines = ["\nRequired Environment Variables:"]
     for var, value in required_vars.items():
         if value:
             # Mask sensitive values
-            if 'SECRET' in var or 'KEY' in var:
-                display_value = value[:4] + '...' + value[-4:] if len(value) > 8 else '***'
+            if var in _SENSITIVE:
+                display_value = f"{value[:4]}...{value[-4:]}" if len(value) > 8 else '***'
             else:
                 display_value = value
-            print(f"  ✓ {var}: {display_value}")
+            lines.append(f"  ✓ {var}: {display_value}")
         else:
-            print(f"  ❌ {var}: NOT SET")
+            lines.append(f"  ❌ {var}: NOT SET")
             all_good = False
     
-    print("\nOptional Environment Variables (using defaults if not set):")
-    for var, value in optional_vars.items():
-        print(f"  • {var}: {value}")
+    lines.append("\nOptional Environment Variables (using defaults if not set):")
+    lines.extend(f"  • {var}: {value}" for var, value in optional_vars.items())
+    _write(lines)
     
     return all_good
 
-def check_dynamodb_connection():
-    """Check if DynamoDB connection works"""
+@functools.lru_cache(maxsize=1)
+def _get_dynamodb_client():
+    """Build one pooled DynamoDB client shared by every table check"""
+    # boto3 stays a local import so runs that fail the .env checks never load it
+    import boto3
+    from botocore.config import Config
+    from app.dynamodb_module.client import AWS_REGION, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY
+
+    session = boto3.session.Session(
+        aws_access_key_id=AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+        region_name=AWS_REGION,
+    )
+    return session.client(
+        'dynamodb',
+        config=Config(max_pool_connections=4, retries={'max_attempts': 2}),
+    )
+
+_TABLE_HINT = "    Make sure the table exists. Run: python -m app.dynamodb_module.init_tables"
+
+def _describe(table_name):
+    """Return (status, item_count) for a DynamoDB table"""
+    table = _get_dynamodb_client().describe_table(TableName=table_name)['Table']
+    return table['TableStatus'], table['ItemCount']
+
+def _list_table_names():
+    """Return the set of all table names, following LastEvaluatedTableName"""
+    paginator = _get_dynamodb_client().get_paginator('list_tables')
+    names = set()
+    for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+        names.update(page.get('TableNames', []))
+    return names
+
+def _check_one(table_name):
+    """Describe one table; return (ok, report lines)"""
     try:
-        from app.dynamodb_module import get_dynamodb_resource, USER_PROFILES_TABLE, HEALTH_DATA_TABLE
+        status, item_count = _describe(table_name)
+    except Exception as e:
+        return False, [f"  ❌ Error accessing '{table_name}' table: {e}", _TABLE_HINT]
+    return True, [
+        f"  ✓ Connected to '{table_name}' table",
+        f"    Status: {status}",
+        f"    Item count: {item_count}",
+    ]
+
+def check_dynamodb_connection(fast=False):
+    """Check if DynamoDB connection works; fast=True only checks that the tables exist"""
+    lines = []
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        from app.dynamodb_module import USER_PROFILES_TABLE, HEALTH_DATA_TABLE
         
-        print("\nTesting DynamoDB Connection...")
-        dynamodb = get_dynamodb_resource()
+        _write(["\nTesting DynamoDB Connection..."])
+        tables = (USER_PROFILES_TABLE, HEALTH_DATA_TABLE)
         
-        # Test user_profiles table
-        try:
-            table = dynamodb.Table(USER_PROFILES_TABLE)
-            table.load()
-            print(f"  ✓ Connected to '{USER_PROFILES_TABLE}' table")
-            print(f"    Status: {table.table_status}")
-            print(f"    Item count: {table.item_count}")
-        except Exception as e:
-            print(f"  ❌ Error accessing '{USER_PROFILES_TABLE}' table: {e}")
-            print(f"    Make sure the table exists. Run: python -m app.dynamodb_module.init_tables")
-            return False
+        if fast:
+            # One ListTables call instead of a DescribeTable per table; needs dynamodb:ListTables.
+            # ItemCount is only refreshed every few hours, so existence is enough for automation.
+            existing = _list_table_names()
+            missing = [name for name in tables if name not in existing]
+            if missing:
+                lines.extend(f"  ❌ Error accessing '{table_name}' table: table not found" for table_name in missing)
+                lines.append(_TABLE_HINT)
+                return False
+            lines.extend(f"  ✓ Found '{table_name}' table" for table_name in tables)
+            return True
         
-        # Test health_data table
-        try:
-            table = dynamodb.Table(HEALTH_DATA_TABLE)
-            table.load()
-            print(f"  ✓ Connected to '{HEALTH_DATA_TABLE}' table")
-            print(f"    Status: {table.table_status}")
-            print(f"    Item count: {table.item_count}")
-        except Exception as e:
-            print(f"  ❌ Error accessing '{HEALTH_DATA_TABLE}' table: {e}")
-            print(f"    Make sure the table exists. Run: python -m app.dynamodb_module.init_tables")
-            return False
+        # Describe all tables concurrently over the shared connection pool
+        with ThreadPoolExecutor(max_workers=len(tables)) as executor:
+            for ok, report in executor.map(_check_one, tables):
+                lines.extend(report)
+                if not ok:
+                    return False
         
         return True
     except Exception as e:
-        print(f"  ❌ Error connecting to DynamoDB: {e}")
-        print("    Check your AWS credentials and region configuration")
+        lines.extend([
+            f"  ❌ Error connecting to DynamoDB: {e}",
+            "    Check your AWS credentials and region configuration",
+        ])
         return False
+    finally:
+        _write(lines)
+
+def build_checks(args):
+    """Return the (name, check, hint) table with CLI options bound into each check"""
+    return (
+        ("Environment File", check_env_file, "Please create a .env file first."),
+        ("Environment Variables", check_env_variables, "Please set required environment variables."),
+        ("DynamoDB Connection", functools.partial(check_dynamodb_connection, fast=args.fast), None),
+    )
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Verify AWS DynamoDB setup")
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Only check that the tables exist with one ListTables call (skips DescribeTable status/item counts)",
+    )
+    return parser.parse_args(argv)
 
-def main():
-    print("=" * 60)
-    print("AWS DynamoDB Setup Verification")
-    print("=" * 60)
+def main(argv=None):
+    args = parse_args(argv)
+    _write(["=" * 60, "AWS DynamoDB Setup Verification", "=" * 60])
     
     checks = []
+    for check_name, check, hint in build_checks(args):
+        passed = check()
+        checks.append((check_name, passed))
+        if not passed:
+            if hint:
+                _write([f"\n❌ Setup incomplete. {hint}"])
+            break
     
-    # Check 1: .env file exists
-    checks.append(("Environment File", check_env_file()))
-    
-    if not checks[-1][1]:
-        print("\n❌ Setup incomplete. Please create a .env file first.")
-        sys.exit(1)
-    
-    # Check 2: Environment variables
-    checks.append(("Environment Variables", check_env_variables()))
-    
-    if not checks[-1][1]:
-        print("\n❌ Setup incomplete. Please set required environment variables.")
-        sys.exit(1)
-    
-    # Check 3: DynamoDB connection
-    checks.append(("DynamoDB Connection", check_dynamodb_connection()))
+    all_passed = all(passed for _, passed in checks)
     
     # Summary
-    print("\n" + "=" * 60)
-    print("Verification Summary")
-    print("=" * 60)
-    
-    all_passed = True
-    for check_name, result in checks:
-        status = "✓ PASS" if result else "❌ FAIL"
-        print(f"{status}: {check_name}")
-        if not result:
-            all_passed = False
-    
+    summary = ["", "=" * 60, "Verification Summary", "=" * 60]
+    summary.extend(f"{'✓ PASS' if passed else '❌ FAIL'}: {check_name}" for check_name, passed in checks)
     if all_passed:
-        print("\n🎉 All checks passed! Your AWS setup is complete.")
-        print("\nNext steps:")
-        print("  1. Start your Flask application: python -m app.main")
-        print("  2. Test the API endpoints")
+        summary.extend([
+            "\n🎉 All checks passed! Your AWS setup is complete.",
+            "\nNext steps:",
+            "  1. Start your Flask application: python -m app.main",
+            "  2. Test the API endpoints",
+        ])
     else:
-        print("\n⚠️  Some checks failed. Please review the errors above.")
+        summary.append("\n⚠️  Some checks failed. Please review the errors above.")
+    _write(summary)
+    
+    if not all_passed:
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""Shared helpers for the logger test modules."""
+
+import logging
+import unittest
+from contextlib import contextmanager
+
+from app.logger import get_logger
+
+
+class ListHandler(logging.Handler):
+    """Handler that collects emitted records in ``self.records``."""
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+
+    def handle(self, record):
+        # Skips the handler lock, which is only safe for single-threaded capture:
+        # records arrive on the test's own thread. A QueueListener thread (as in
+        # TestQueuePath) only feeds its own handlers, never this one; attaching a
+        # ListHandler there would need the lock back.
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@contextmanager
+def captured_handler(logger, level=logging.DEBUG):
+    """Attach a ListHandler to ``logger`` and yield its record list."""
+    handler = ListHandler(level)
+    prev_level = logger.level
+    logger.addHandler(handler)
+    if prev_level != level:
+        logger.setLevel(level)
+    try:
+        yield handler.records
+    finally:
+        logger.removeHandler(handler)
+        if logger.level != prev_level:
+            logger.setLevel(prev_level)
+
+
+class LogCaptureTestCase(unittest.TestCase):
+    """
+    Base class that captures records from ``logger_name`` for the whole class.
+
+    The handler is attached once in setUpClass; each test starts with an
+    empty ``self.log_records``.
+    """
+
+    logger_name = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.logger = get_logger(cls.logger_name)
+        cls._records = cls.enterClassContext(captured_handler(cls.logger))
+
+    def setUp(self):
+        self._records.clear()
+        self.log_records = self._records
@@ -22,6 +22,9 @@ try:
 except ImportError:
     User = None
 
+# Manual upload script, not a test module
+collect_ignore = ["upload_video.py"]
+
 
 def _make_supabase_auth_response(user_id="test-uuid", email="test@example.com", username="testuser"):
     """Build a fake Supabase sign_up/sign_in response with .user and .session."""
@@ -53,6 +56,53 @@ def app():
     return app
 
 
+@pytest.fixture(scope="session")
+def build_main_app():
+    """
+    Factory for the full app.main application.
+
+    Apps use an in-memory SQLite DB so tests never write app/instance/users.db,
+    and benchmark loading is stubbed with the given dict.
+    """
+    from app.main import create_app as _create_app
+
+    def _build(benchmarks=None):
+        with patch("app.main.load_fitness_benchmarks", return_value=benchmarks or {}):
+            return _create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
+
+    return _build
+
+
+@pytest.fixture(scope="session")
+def main_app(build_main_app):
+    """Full app.main application, built once per session with benchmark loading stubbed."""
+    return build_main_app()
+
+
+@pytest.fixture
+def main_client(main_app):
+    """Test client for the shared main_app."""
+    return main_app.test_client()
+
+
+@pytest.fixture
+def mocked_genai(monkeypatch):
+    """
+    Replace the genai module used by app.chatbot.ai_recommendations.
+
+    Returns (genai, model, response); tests only need to set response.text.
+    """
+    import app.chatbot.ai_recommendations as ai_recommendations
+
+    fake = MagicMock()
+    model = fake.GenerativeModel.return_value
+    # Responses are only read, never asserted on; a plain namespace is enough.
+    response = SimpleNamespace(text="DEFAULT", candidates=[])
+    model.generate_content.return_value = response
+    monkeypatch.setattr(ai_recommendations, "genai", fake)
+    return fake, model, response
+
+
 @pytest.fixture
 def app_with_supabase_mock(app):
     """
@@ -8,24 +8,35 @@ Tests cover:
 - Response parsing and validation
 """
 
+import sys
+from pathlib import Path
 import unittest
-from unittest.mock import patch, MagicMock
-from app.database.models import UserProfile
+from types import SimpleNamespace
+
+import pytest
+
+# Run directly as a script: put the project root on sys.path (pytest uses pytest.ini's pythonpath)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 from app.chatbot.ai_recommendations import get_ai_recommendation
+from app.database.models import UserProfile
 
 
-class TestAIRecommendationBasic(unittest.TestCase):
+class _MockedGenaiTestCase(unittest.TestCase):
+    """Base class exposing the shared mocked_genai fixture on self."""
+    
+    @pytest.fixture(autouse=True)
+    def _use_mocked_genai(self, mocked_genai):
+        self.mock_genai, self.mock_model, self.mock_response = mocked_genai
+
+
+class TestAIRecommendationBasic(_MockedGenaiTestCase):
     """Test basic AI recommendation functionality."""
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_get_recommendation_with_full_profile(self, mock_genai):
+    def test_get_recommendation_with_full_profile(self):
         """Test getting recommendation with complete user profile."""
-        # Setup mock
-        mock_model = MagicMock()
-        mock_genai.GenerativeModel.return_value = mock_model
-        mock_response = MagicMock()
-        mock_response.text = "Here's your fitness recommendation..."
-        mock_model.generate_content.return_value = mock_response
+        self.mock_response.text = "Here's your fitness recommendation..."
         
         # Create profile
         profile = UserProfile(
@@ -46,17 +57,12 @@ class TestAIRecommendationBasic(unittest.TestCase):
         
         # Assertions
         self.assertEqual(response, "Here's your fitness recommendation...")
-        mock_genai.configure.assert_called_once_with(api_key="test_key")
-        mock_model.generate_content.assert_called_once()
+        self.mock_genai.configure.assert_called_once_with(api_key="test_key")
+        self.mock_model.generate_content.assert_called_once()
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_get_recommendation_with_minimal_profile(self, mock_genai):
+    def test_get_recommendation_with_minimal_profile(self):
         """Test getting recommendation with minimal user profile."""
-        mock_model = MagicMock()
-        mock_genai.GenerativeModel.return_value = mock_model
-        mock_response = MagicMock()
-        mock_response.text = "Basic fitness advice"
-        mock_model.generate_content.return_value = mock_response
+        self.mock_response.text = "Basic fitness advice"
         
         profile = UserProfile(name="Jane Doe")
         
@@ -67,16 +73,11 @@ class TestAIRecommendationBasic(unittest.TestCase):
         )
         
         self.assertEqual(response, "Basic fitness advice")
-        mock_model.generate_content.assert_called_once()
+        self.mock_model.generate_content.assert_called_once()
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_recommendation_includes_profile_data(self, mock_genai):
+    def test_recommendation_includes_profile_data(self):
         """Test that profile data is included in the prompt."""
-        mock_model = MagicMock()
-        mock_genai.GenerativeModel.return_value = mock_model
-        mock_response = MagicMock()
-        mock_response.text = "Personalized recommendation"
-        mock_model.generate_content.return_value = mock_response
+        self.mock_response.text = "Personalized recommendation"
         
         profile = UserProfile(
             name="Alice",
@@ -92,7 +93,7 @@ class TestAIRecommendationBasic(unittest.TestCase):
         )
         
         # Get the prompt that was sent
-        call_args = mock_model.generate_content.call_args
+        call_args = self.mock_model.generate_content.call_args
         prompt = call_args[1]['contents'] if 'contents' in call_args[1] else call_args[0][0]
         
         # Check that profile data is in the prompt
@@ -102,7 +103,7 @@ class TestAIRecommendationBasic(unittest.TestCase):
         self.assertIn("endurance", prompt)
 
 
-class TestAIRecommendationErrorHandling(unittest.TestCase):
+class TestAIRecommendationErrorHandling(_MockedGenaiTestCase):
     """Test error handling in AI recommendations."""
     
     def test_missing_api_key(self):
@@ -131,10 +132,9 @@ class TestAIRecommendationErrorHandling(unittest.TestCase):
         
         self.assertIn("GEMINI_API_KEY", str(context.exception))
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_api_call_failure(self, mock_genai):
+    def test_api_call_failure(self):
         """Test that API call failures raise Exception."""
-        mock_genai.configure.side_effect = Exception("API connection failed")
+        self.mock_genai.configure.side_effect = Exception("API connection failed")
         
         profile = UserProfile(name="David")
         
@@ -145,49 +145,28 @@ class TestAIRecommendationErrorHandling(unittest.TestCase):
                 api_key="test_key"
             )
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_no_response_text(self, mock_genai):
+    def test_no_response_text(self):
         """Test handling of responses without text."""
-        mock_model = MagicMock()
-        mock_genai.GenerativeModel.return_value = mock_model
-        mock_response = MagicMock()
-        mock_response.text = None
-        mock_response.candidates = []
-        # Make hasattr work correctly for our mock
-        def mock_hasattr(obj, attr):
-            if attr == 'text':
-                return True  # has text attribute
-            elif attr == 'candidates':
-                return True  # has candidates attribute
-            return hasattr(obj, attr)
-        
-        # Use side_effect to control the response behavior
-        with patch('builtins.hasattr', side_effect=mock_hasattr):
-            mock_model.generate_content.return_value = mock_response
-            
-            profile = UserProfile(name="Eve")
-            
-            with self.assertRaises(Exception) as context:
-                get_ai_recommendation(
-                    profile=profile,
-                    message="Test message",
-                    api_key="test_key"
-                )
-            
-            self.assertIn("No response text", str(context.exception))
+        self.mock_model.generate_content.return_value = SimpleNamespace(text=None, candidates=[])
+        
+        profile = UserProfile(name="Eve")
+        
+        with self.assertRaises(Exception) as context:
+            get_ai_recommendation(
+                profile=profile,
+                message="Test message",
+                api_key="test_key"
+            )
+        
+        self.assertIn("No response text", str(context.exception))
 
 
-class TestAIRecommendationResponseParsing(unittest.TestCase):
+class TestAIRecommendationResponseParsing(_MockedGenaiTestCase):
     """Test response parsing from Gemini API."""
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_response_with_text_attribute(self, mock_genai):
+    def test_response_with_text_attribute(self):
         """Test parsing response with text attribute."""
-        mock_model = MagicMock()
-        mock_genai.GenerativeModel.return_value = mock_model
-        mock_response = MagicMock()
-        mock_response.text = "AI-generated response text"
-        mock_model.generate_content.return_value = mock_response
+        self.mock_response.text = "AI-generated response text"
         
         profile = UserProfile(name="Frank")
         
@@ -199,23 +178,14 @@ class TestAIRecommendationResponseParsing(unittest.TestCase):
         
         self.assertEqual(response, "AI-generated response text")
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_response_with_candidates(self, mock_genai):
+    def test_response_with_candidates(self):
         """Test parsing response from candidates fallback."""
-        mock_model = MagicMock()
-        mock_genai.GenerativeModel.return_value = mock_model
-        
         # Create mock candidates response
-        mock_response = MagicMock()
-        mock_response.text = None  # No text attribute
-        mock_part = MagicMock()
-        mock_part.text = "Response from candidates"
-        mock_content = MagicMock()
-        mock_content.parts = [mock_part]
-        mock_candidate = MagicMock()
-        mock_candidate.content = mock_content
-        mock_response.candidates = [mock_candidate]
-        mock_model.generate_content.return_value = mock_response
+        self.mock_response.text = None  # No text attribute
+        mock_part = SimpleNamespace(text="Response from candidates")
+        mock_content = SimpleNamespace(parts=[mock_part])
+        mock_candidate = SimpleNamespace(content=mock_content)
+        self.mock_response.candidates = [mock_candidate]
         
         profile = UserProfile(name="Grace")
         
@@ -228,17 +198,12 @@ class TestAIRecommendationResponseParsing(unittest.TestCase):
         self.assertEqual(response, "Response from candidates")
 
 
-class TestAIRecommendationPromptConstruction(unittest.TestCase):
+class TestAIRecommendationPromptConstruction(_MockedGenaiTestCase):
     """Test prompt construction from profile and message."""
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_prompt_with_all_profile_fields(self, mock_genai):
+    def test_prompt_with_all_profile_fields(self):
         """Test that all profile fields are included in prompt."""
-        mock_model = MagicMock()
-        mock_genai.GenerativeModel.return_value = mock_model
-        mock_response = MagicMock()
-        mock_response.text = "Response"
-        mock_model.generate_content.return_value = mock_response
+        self.mock_response.text = "Response"
         
         profile = UserProfile(
             name="Henry",
@@ -255,27 +220,17 @@ class TestAIRecommendationPromptConstruction(unittest.TestCase):
             api_key="test_key"
         )
         
-        call_args = mock_model.generate_content.call_args
+        call_args = self.mock_model.generate_content.call_args
         prompt = call_args[1]['contents'] if 'contents' in call_args[1] else call_args[0][0]
         
         # Verify all fields are in prompt
-        self.assertIn("Henry", prompt)
-        self.assertIn("35", prompt)
-        self.assertIn("male", prompt)
-        self.assertIn("6'0\"", prompt)
-        self.assertIn("200 lbs", prompt)
-        self.assertIn("strength", prompt)
-        self.assertIn("endurance", prompt)
-        self.assertIn("How to train?", prompt)
+        expected = ("Henry", "35", "male", "6'0\"", "200 lbs", "strength", "endurance", "How to train?")
+        missing = [field for field in expected if field not in prompt]
+        self.assertFalse(missing, f"Missing from prompt: {missing}")
     
-    @patch('app.chatbot.ai_recommendations.genai')
-    def test_prompt_with_empty_profile(self, mock_genai):
+    def test_prompt_with_empty_profile(self):
         """Test prompt construction with minimal profile."""
-        mock_model = MagicMock()
-        mock_genai.GenerativeModel.return_value = mock_model
-        mock_response = MagicMock()
-        mock_response.text = "Response"
-        mock_model.generate_content.return_value = mock_response
+        self.mock_response.text = "Response"
         
         profile = UserProfile(name=None)
         
@@ -285,7 +240,7 @@ class TestAIRecommendationPromptConstruction(unittest.TestCase):
             api_key="test_key"
         )
         
-        call_args = mock_model.generate_content.call_args
+        call_args = self.mock_model.generate_content.call_args
         prompt = call_args[1]['contents'] if 'contents' in call_args[1] else call_args[0][0]
         
         # Should still include the message
@@ -293,4 +248,5 @@ class TestAIRecommendationPromptConstruction(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main()
+    # mocked_genai is a pytest fixture, so run through pytest rather than unittest
+    raise SystemExit(pytest.main([__file__]))
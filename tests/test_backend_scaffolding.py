@@ -8,33 +8,69 @@ Tests cover:
 - Error handling and logging
 """
 
+import sys
+from pathlib import Path
 import unittest
+from types import MappingProxyType
 from unittest.mock import patch, MagicMock
-import json
-from app.main import create_app
+
+import pytest
+
+# Run directly as a script: put the project root on sys.path (pytest uses pytest.ini's pythonpath)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 from app.database.models import UserProfile
-from app.logger import get_logger
+from app.main import create_app
 from app.scaffolding_chat import scaffold_chat_post
 
+# In-memory DB so app-building tests never share app/instance/users.db across xdist workers
+_TEST_CONFIG = MappingProxyType({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+
+# Read-only so one test cannot leak edits into another; copy with dict() per payload.
+_BASE_PROFILE = MappingProxyType({
+    'name': 'John Doe',
+    'age': 30,
+    'gender': 'male',
+    'height': "5'10\"",
+    'weight': '180 lbs',
+    'fitness_goals': ('lose weight', 'build strength'),
+})
+
+
+@pytest.fixture(scope="module")
+def integration_app(build_main_app):
+    """App for the end-to-end flow, loaded with strength and cardio benchmarks."""
+    return build_main_app({'strength': {}, 'cardio': {}})
+
 
 def _call_scaffold_chat(app, payload: dict):
     """Invoke scaffold chat logic (replaces former POST /api/scaffolding/chat)."""
     with app.app_context():
-        with app.test_request_context(
-            "/",
-            method="POST",
-            data=json.dumps(payload),
-            content_type="application/json",
-        ):
+        with app.test_request_context("/", method="POST", json=payload):
             return scaffold_chat_post()
 
 
+class _AppTestBase(unittest.TestCase):
+    """Base class for tests that share the session-wide app.main instance."""
+    
+    @pytest.fixture(autouse=True)
+    def _use_shared_app(self, main_app, main_client):
+        """Use the session-wide app and a fresh test client."""
+        self.app = main_app
+        self.client = main_client
+    
+    def _ok(self, response):
+        """Assert a 200 response, showing the body if it is not."""
+        assert response.status_code == 200, response.data
+
+
 class TestAppCreation(unittest.TestCase):
     """Test Flask app creation and initialization."""
     
     def test_create_app_returns_flask_app(self):
         """Test that create_app returns a Flask application."""
-        app = create_app()
+        app = create_app(_TEST_CONFIG)
         
         self.assertIsNotNone(app)
         self.assertTrue(hasattr(app, 'route'))  # Flask app has route method
@@ -44,7 +80,7 @@ class TestAppCreation(unittest.TestCase):
         """Test that benchmarks are loaded when app is created."""
         mock_load_benchmarks.return_value = {'test': 'benchmarks'}
         
-        app = create_app()
+        app = create_app(_TEST_CONFIG)
         
         # Verify benchmarks were loaded
         mock_load_benchmarks.assert_called_once()
@@ -56,32 +92,24 @@ class TestAppCreation(unittest.TestCase):
         mock_load_benchmarks.side_effect = Exception("Benchmark load failed")
         
         with self.assertRaises(Exception):
-            create_app()
+            create_app(_TEST_CONFIG)
     
     def test_app_has_database(self):
-        """Test that app is configured with database."""
-        app = create_app()
+        """Test that app is configured with database, honouring a test_config override."""
+        app = create_app(_TEST_CONFIG)
         
-        self.assertIn('SQLALCHEMY_DATABASE_URI', app.config)
-        self.assertIn('users.db', app.config['SQLALCHEMY_DATABASE_URI'])
+        self.assertEqual(app.config['SQLALCHEMY_DATABASE_URI'], 'sqlite://')
     
     def test_app_has_secret_key(self):
         """Test that app has a secret key configured."""
-        app = create_app()
+        app = create_app(_TEST_CONFIG)
         
         self.assertIsNotNone(app.config['SECRET_KEY'])
 
 
-class TestChatAPIEndpoint(unittest.TestCase):
+class TestChatAPIEndpoint(_AppTestBase):
     """Test scaffold chat handler (AI recommendation flow)."""
     
-    def setUp(self):
-        """Set up test client."""
-        with patch('app.main.load_fitness_benchmarks') as mock_load:
-            mock_load.return_value = {}
-            self.app = create_app()
-            self.client = self.app.test_client()
-    
     @patch('app.scaffolding_chat.get_ai_recommendation')
     def test_chat_api_with_message_and_profile(self, mock_ai):
         """Test scaffold chat with message and profile."""
@@ -98,7 +126,7 @@ class TestChatAPIEndpoint(unittest.TestCase):
         
         response = _call_scaffold_chat(self.app, payload)
         
-        self.assertEqual(response.status_code, 200)
+        self._ok(response)
         data = response.get_json()
         self.assertIn('response', data)
         self.assertEqual(data['response'], "Here's your fitness recommendation")
@@ -127,7 +155,7 @@ class TestChatAPIEndpoint(unittest.TestCase):
         
         response = _call_scaffold_chat(self.app, payload)
         
-        self.assertEqual(response.status_code, 200)
+        self._ok(response)
         data = response.get_json()
         self.assertEqual(data['response'], "General fitness advice")
     
@@ -154,9 +182,8 @@ class TestChatAPIEndpoint(unittest.TestCase):
         profile_arg = call_args[1]['profile']
         
         self.assertIsInstance(profile_arg, UserProfile)
-        self.assertEqual(profile_arg.name, 'Alice')
-        self.assertEqual(profile_arg.age, 25)
-        self.assertEqual(profile_arg.gender, 'female')
+        actual = {k: getattr(profile_arg, k) for k in ('name', 'age', 'gender')}
+        self.assertEqual(actual, {'name': 'Alice', 'age': 25, 'gender': 'female'})
         self.assertIn('endurance', profile_arg.fitness_goals)
     
     @patch('app.scaffolding_chat.get_ai_recommendation')
@@ -212,38 +239,30 @@ class TestChatAPIEndpoint(unittest.TestCase):
         self.assertIn('error', data)
 
 
-class TestFrontendRoutes(unittest.TestCase):
+class TestFrontendRoutes(_AppTestBase):
     """Test frontend routes."""
     
-    def setUp(self):
-        """Set up test client."""
-        with patch('app.main.load_fitness_benchmarks') as mock_load:
-            mock_load.return_value = {}
-            self.app = create_app()
-            self.client = self.app.test_client()
-    
     def test_index_route_accessible(self):
         """Test that / route is accessible."""
         response = self.client.get('/')
         
-        self.assertEqual(response.status_code, 200)
+        self._ok(response)
     
     def test_chat_route_accessible(self):
         """Test that /chat route is accessible."""
         response = self.client.get('/chat')
         
-        self.assertEqual(response.status_code, 200)
+        self._ok(response)
 
 
-class TestIntegrationFlow(unittest.TestCase):
+class TestIntegrationFlow(_AppTestBase):
     """Test complete integration flow."""
     
-    def setUp(self):
-        """Set up test client."""
-        with patch('app.main.load_fitness_benchmarks') as mock_load:
-            mock_load.return_value = {'strength': {}, 'cardio': {}}
-            self.app = create_app()
-            self.client = self.app.test_client()
+    @pytest.fixture(autouse=True)
+    def _use_shared_app(self, integration_app):
+        """Use an app of its own that carries real-looking benchmarks."""
+        self.app = integration_app
+        self.client = integration_app.test_client()
     
     @patch('app.scaffolding_chat.get_ai_recommendation')
     def test_full_chat_flow(self, mock_ai):
@@ -251,23 +270,13 @@ class TestIntegrationFlow(unittest.TestCase):
         mock_ai.return_value = "Your personalized fitness plan..."
         
         # Prepare request
-        payload = {
-            'message': 'Create a fitness plan for me',
-            'profile': {
-                'name': 'John Doe',
-                'age': 30,
-                'gender': 'male',
-                'height': "5'10\"",
-                'weight': '180 lbs',
-                'fitness_goals': ['lose weight', 'build strength']
-            }
-        }
+        payload = {'message': 'Create a fitness plan for me', 'profile': dict(_BASE_PROFILE)}
         
         # Send request
         response = _call_scaffold_chat(self.app, payload)
         
         # Verify response
-        self.assertEqual(response.status_code, 200)
+        self._ok(response)
         data = response.get_json()
         self.assertEqual(data['response'], "Your personalized fitness plan...")
         
@@ -277,13 +286,13 @@ class TestIntegrationFlow(unittest.TestCase):
         
         # Check profile
         profile = call_args[1]['profile']
-        self.assertEqual(profile.name, 'John Doe')
-        self.assertEqual(profile.age, 30)
-        self.assertEqual(profile.gender, 'male')
+        actual = {k: getattr(profile, k) for k in ('name', 'age', 'gender')}
+        self.assertEqual(actual, {'name': 'John Doe', 'age': 30, 'gender': 'male'})
         
         # Check message
         self.assertEqual(call_args[1]['message'], payload['message'])
 
 
 if __name__ == "__main__":
-    unittest.main()
+    # The shared app comes from pytest fixtures, so run through pytest rather than unittest
+    raise SystemExit(pytest.main([__file__]))
@@ -7,7 +7,13 @@ Tests cover:
 - Error handling
 """
 
+import sys
+from pathlib import Path
 import unittest
+# Run directly as a script: put the project root on sys.path (pytest uses pytest.ini's pythonpath)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 from app.fitness.benchmark_loader import load_fitness_benchmarks, _normalize_categories
 
 
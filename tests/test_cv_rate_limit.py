@@ -35,7 +35,7 @@ def app(monkeypatch, tmp_path):
         },
     )
 
-    app = main_module.create_app()
+    app = main_module.create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
     app.testing = True
     with app.app_context():
         db.create_all()
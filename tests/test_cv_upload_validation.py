@@ -18,7 +18,7 @@ def app(monkeypatch, tmp_path):
     monkeypatch.setattr(main_module, "load_fitness_benchmarks", lambda: {"strength": {"example": 1}})
     monkeypatch.setattr(routes_module, "VIDEO_IN_DIR", str(tmp_path))
 
-    app = main_module.create_app()
+    app = main_module.create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
     app.testing = True
     return app
 
@@ -0,0 +1,50 @@
+"""
+Unit tests for the DynamoDB resource cache (dynamodb_module.client).
+
+boto3.resource is patched, so no AWS access is needed.
+"""
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+import app.dynamodb_module.client as client
+
+
+@pytest.fixture
+def fake_boto3_resource(monkeypatch):
+    """Make boto3.resource return a new object per call and clear the cache around the test."""
+    factory = MagicMock(side_effect=lambda *args, **kwargs: object())
+    monkeypatch.setattr(client.boto3, "resource", factory)
+    client.reset_dynamodb_resource()
+    yield factory
+    client.reset_dynamodb_resource()
+
+
+def test_resource_is_reused_within_a_thread(fake_boto3_resource):
+    """Two calls on one thread return the same resource."""
+    first = client.get_dynamodb_resource()
+
+    assert client.get_dynamodb_resource() is first
+    fake_boto3_resource.assert_called_once()
+
+
+def test_reset_builds_a_new_resource(fake_boto3_resource):
+    """reset_dynamodb_resource() drops the cached resource."""
+    first = client.get_dynamodb_resource()
+    client.reset_dynamodb_resource()
+
+    assert client.get_dynamodb_resource() is not first
+    assert fake_boto3_resource.call_count == 2
+
+
+def test_each_thread_gets_its_own_resource(fake_boto3_resource):
+    """Resources are not shared across threads (boto3 resources are not thread-safe)."""
+    main_resource = client.get_dynamodb_resource()
+    seen = []
+
+    worker = threading.Thread(target=lambda: seen.append(client.get_dynamodb_resource()))
+    worker.start()
+    worker.join()
+
+    assert seen[0] is not main_resource
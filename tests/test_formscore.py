@@ -5,12 +5,16 @@ from unittest.mock import MagicMock, patch, mock_open, ANY
 import numpy as np
 import boto3
 import io
+from pathlib import Path
 
 from dotenv import load_dotenv
 load_dotenv()
 
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Run directly as a script: put the project root on sys.path (pytest uses pytest.ini's pythonpath)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 from app.exercises.exercise import Exercise, EXERCISE_PRESETS
 from app.exercises.routes import parse_user_video
 from app.exercises.openpose import generate_pose, fetch_standard_data, score_func, FormScore, user_output
@@ -19,6 +23,8 @@ AWS_ACCESS_KEY = os.getenv('AWS_ACCESS_KEY_ID')
 AWS_SECRET_KEY = os.getenv('AWS_SECRET_ACCESS_KEY')
 REGION = os.getenv('AWS_REGION')
 
+_BICEP = EXERCISE_PRESETS["bicep_curl"]
+
 s3 = boto3.client(
     's3',
     aws_access_key_id=AWS_ACCESS_KEY,
@@ -48,16 +54,18 @@ class TestS3(unittest.TestCase):
         self.assertEqual(result['form_score'], 85.0)
 
 class TestExerciseClass(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Shared read-only preset; copy.deepcopy it in any test that mutates it
+        cls._bicep = Exercise.from_preset("bicep_curl")
+
     def test_from_preset_builds_expected_exercise(self):
 
-        exercise = Exercise.from_preset("bicep_curl")
+        exercise = self._bicep
 
-        self.assertEqual(exercise.name, EXERCISE_PRESETS["bicep_curl"]["name"])
-        self.assertEqual(exercise.joint_group, EXERCISE_PRESETS["bicep_curl"]["joint_group"])
-        self.assertEqual(
-            exercise.isolated_movement,
-            EXERCISE_PRESETS["bicep_curl"]["isolated_movement"],
-        )
+        self.assertEqual(exercise.name, _BICEP["name"])
+        self.assertEqual(exercise.joint_group, _BICEP["joint_group"])
+        self.assertEqual(exercise.isolated_movement, _BICEP["isolated_movement"])
 
     def test_set_frame_values_populates_metrics_and_derivatives(self):
         exercise = Exercise("Bicep Curl", ["RWrist"], False)
@@ -70,6 +78,43 @@ class TestExerciseClass(unittest.TestCase):
         self.assertEqual(len(exercise.x_metrics["RWrist velocity"]), 3)
         self.assertEqual(len(exercise.y_metrics["RWrist acceleration"]), 3)
 
+    def test_set_frame_values_array_matches_set_frame_values(self):
+        joints = ["RWrist", "RElbow"]
+        xy = np.array([
+            [[0, 10], [10, 20], [20, 30], [35, 32], [38, 20]],
+            [[5, 5], [7, 9], [12, 16], [13, 24], [20, 30]],
+        ], dtype=float)
+        frame_vals = {
+            joint: {frame: tuple(point) for frame, point in enumerate(points)}
+            for joint, points in zip(joints, xy)
+        }
+        from_dict = Exercise("Bicep Curl", joints, False)
+        from_dict.set_frame_values(frame_vals, frame_count=5, fps=2, frame_width=20, frame_height=40)
+        from_array = Exercise("Bicep Curl", joints, False)
+
+        from_array.set_frame_values_array(xy, fps=2, frame_width=20, frame_height=40)
+
+        self.assertEqual(from_array.frame_count, 5)
+        for metrics in ("x_metrics", "y_metrics"):
+            expected = getattr(from_dict, metrics)
+            actual = getattr(from_array, metrics)
+            self.assertEqual(actual.keys(), expected.keys())
+            for key in expected:
+                np.testing.assert_allclose(actual[key], expected[key], err_msg=key)
+
+    def test_set_frame_values_array_rejects_bad_shapes(self):
+        exercise = Exercise("Bicep Curl", ["RWrist", "RElbow"], False)
+
+        for xy in (
+            np.zeros((1, 3, 2)),  # fewer joints than joint_group
+            np.zeros((3, 3, 2)),  # more joints than joint_group
+            np.zeros((2, 3)),     # missing the coordinate axis
+            np.zeros((2, 3, 3)),  # coordinates are not (x, y)
+        ):
+            with self.subTest(shape=xy.shape):
+                with self.assertRaises(ValueError):
+                    exercise.set_frame_values_array(xy, fps=2, frame_width=20, frame_height=40)
+
     def test_single_sample_uses_zero_velocity_and_acceleration(self):
         exercise = Exercise("Bicep Curl", ["RWrist"], False)
         frame_vals = {"RWrist": {0: (50, 25)}}
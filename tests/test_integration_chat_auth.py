@@ -24,7 +24,7 @@ from app.main import create_app
 
 @pytest.fixture
 def app():
-    app = create_app()
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
     app.config.update({"TESTING": True})
     return app
 
@@ -190,7 +190,7 @@ def app(monkeypatch):
     monkeypatch.setattr(chat_routes, "HealthDataService", InMemoryHealthDataService)
     monkeypatch.setattr(chat_routes, "GeminiClient", DummyGeminiClient)
 
-    app = create_app()
+    app = create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
     app.testing = True
     return app
 
@@ -9,18 +9,23 @@ Tests cover:
 - File and console handler setup
 """
 
+import sys
 import unittest
 import logging
 import os
-import sys
+from logging.handlers import QueueHandler
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import tempfile
 import shutil
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+
+# Run directly as a script: put the project root on sys.path (pytest uses pytest.ini's pythonpath)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import app.logger as logger_module
 from app.logger import (
     get_logger,
     setup_logging,
@@ -30,30 +35,16 @@ from app.logger import (
     LOG_ENABLED,
     LOG_LEVEL,
 )
+from tests._loghelpers import LogCaptureTestCase
 
+# Logger tests mutate process-wide logging state; keep them on one worker
+pytestmark = pytest.mark.xdist_group("logger_global")
 
+
+@patch.dict(os.environ)
 class TestLoggerBasics(unittest.TestCase):
     """Test basic logger functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Store original values
-        self.original_log_enabled = os.getenv("ENABLE_LOGGING")
-        self.original_log_level = os.getenv("LOG_LEVEL")
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        # Restore original values
-        if self.original_log_enabled:
-            os.environ["ENABLE_LOGGING"] = self.original_log_enabled
-        else:
-            os.environ.pop("ENABLE_LOGGING", None)
-        
-        if self.original_log_level:
-            os.environ["LOG_LEVEL"] = self.original_log_level
-        else:
-            os.environ.pop("LOG_LEVEL", None)
-    
     def test_get_logger_returns_logger_instance(self):
         """Test that get_logger returns a valid Logger instance."""
         logger = get_logger(__name__)
@@ -76,22 +67,10 @@ class TestLoggerBasics(unittest.TestCase):
         self.assertIs(logger1, logger2)
 
 
-class TestLoggingLevels(unittest.TestCase):
+class TestLoggingLevels(LogCaptureTestCase):
     """Test different logging levels."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("test.levels")
-        self.log_records = []
-        
-        # Create a custom handler to capture log records
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "test.levels"
     
     def test_debug_logging(self):
         """Test DEBUG level logging."""
@@ -129,22 +108,10 @@ class TestLoggingLevels(unittest.TestCase):
         self.assertTrue(any(r.levelname == "CRITICAL" for r in self.log_records))
 
 
-class TestLoggingWithExceptionInfo(unittest.TestCase):
+class TestLoggingWithExceptionInfo(LogCaptureTestCase):
     """Test logging with exception information."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("test.exceptions")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "test.exceptions"
     
     def test_error_with_exception_info(self):
         """Test logging error with exception information."""
@@ -170,14 +137,21 @@ class TestEnableDisableFunctionality(unittest.TestCase):
         """Clean up after tests."""
         self.root_logger.handlers = self.original_handlers
     
-    @patch.dict(os.environ, {"ENABLE_LOGGING": "False"})
     def test_logging_disabled_via_env(self):
         """Test that logging can be disabled via environment variable."""
-        # Import with disabled logging
-        from app import logger as logger_module
+        # LOG_ENABLED is computed from the env at import; check the env read and
+        # the disabled flag directly rather than reloading the module
+        with patch.dict(os.environ, {"ENABLE_LOGGING": "False"}):
+            self.assertFalse(logger_module._enabled_from_env())
+        
+        test_logger = logging.getLogger("test.disabled")
+        self.addCleanup(test_logger.setLevel, test_logger.level)
+        self.addCleanup(setattr, test_logger, "handlers", test_logger.handlers.copy())
+        with patch("app.logger.LOG_ENABLED", False):
+            test_logger = logger_module.get_logger("test.disabled")
         
-        test_logger = logger_module.get_logger("test.disabled")
         self.assertIsInstance(test_logger, logging.Logger)
+        self.assertGreater(test_logger.level, logging.CRITICAL)
 
 
 class TestSetLogLevel(unittest.TestCase):
@@ -226,22 +200,10 @@ class TestSetLogLevel(unittest.TestCase):
         self.assertEqual(root_logger.level, logging.WARNING)
 
 
-class TestLogMessageContent(unittest.TestCase):
+class TestLogMessageContent(LogCaptureTestCase):
     """Test that log messages contain expected content."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("test.content")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "test.content"
     
     def test_log_message_content(self):
         """Test that logged message content is preserved."""
@@ -269,5 +231,47 @@ class TestLogMessageContent(unittest.TestCase):
         self.assertIsNotNone(self.log_records[0].created)
 
 
+class TestQueuePath(unittest.TestCase):
+    """Test that setup_logging routes records through the queue listener."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.root_logger = logging.getLogger()
+        self.original_handlers = self.root_logger.handlers.copy()
+        # setup_logging changes the root level; restore it for later tests on this worker
+        self.addCleanup(self.root_logger.setLevel, self.root_logger.level)
+        self.test_log_dir = Path(tempfile.mkdtemp())
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        logger_module._stop_listener()
+        self.root_logger.handlers = self.original_handlers
+        shutil.rmtree(self.test_log_dir)
+    
+    def test_records_drain_through_queue(self):
+        """Test that 1000 records reach the file handler via the listener."""
+        with patch("app.logger.LOG_ENABLED", True), \
+                patch("app.logger.LOG_DIR", self.test_log_dir), \
+                patch("app.logger.LOG_FILE", self.test_log_dir / "app.log"):
+            setup_logging()
+        
+        self.assertEqual(len(self.root_logger.handlers), 1)
+        self.assertIsInstance(self.root_logger.handlers[0], QueueHandler)
+        
+        listener = logger_module._listener
+        logger = get_logger("test.queue")
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.DEBUG)
+        for i in range(1000):
+            logger.debug("queued record %d", i)
+        
+        # Stopping the listener drains whatever is still queued
+        logger_module._stop_listener()
+        
+        self.assertTrue(listener.queue.empty())
+        lines = (self.test_log_dir / "app.log").read_text().splitlines()
+        self.assertEqual(len(lines), 1000)
+
+
 if __name__ == "__main__":
     unittest.main()
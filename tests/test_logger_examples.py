@@ -8,39 +8,36 @@ Tests validate logging patterns from LOGGING_EXAMPLES.md documentation:
 - Error handling logging
 """
 
-import unittest
-import logging
 import sys
 from pathlib import Path
+import unittest
+import re
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+
+# Run directly as a script: put the project root on sys.path (pytest uses pytest.ini's pythonpath)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tests._loghelpers import LogCaptureTestCase
 
-from app.logger import get_logger
+# Logger tests mutate process-wide logging state; keep them on one worker
+pytestmark = pytest.mark.xdist_group("logger_global")
 
+# Validates every structured-context field of a log line in one pass
+_CTX_RE = re.compile(r"user_id=(?P<uid>\d+).*action=(?P<act>\w+).*timestamp=(?P<ts>\S+)")
 
-class TestAuthenticationLogging(unittest.TestCase):
+
+class TestAuthenticationLogging(LogCaptureTestCase):
     """Test logging patterns used in authentication routes."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("app.auth_module.routes")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "app.auth_module.routes"
     
     def test_registration_attempt_logged(self):
         """Test logging registration attempts."""
         username = "newuser"
-        self.logger.info(f"Registration attempt for user: {username}")
+        self.logger.info("Registration attempt for user: %s", username)
         
         self.assertEqual(len(self.log_records), 1)
         self.assertIn(username, self.log_records[0].getMessage())
@@ -48,7 +45,7 @@ class TestAuthenticationLogging(unittest.TestCase):
     def test_registration_validation_warning(self):
         """Test logging validation failures."""
         username = "user"
-        self.logger.warning(f"Registration failed - missing fields for user: {username}")
+        self.logger.warning("Registration failed - missing fields for user: %s", username)
         
         warning_records = [r for r in self.log_records if r.levelname == "WARNING"]
         self.assertTrue(len(warning_records) > 0)
@@ -57,7 +54,7 @@ class TestAuthenticationLogging(unittest.TestCase):
     def test_successful_registration_logged(self):
         """Test logging successful registration."""
         username = "newuser"
-        self.logger.info(f"User registered successfully: {username}")
+        self.logger.info("User registered successfully: %s", username)
         
         info_records = [r for r in self.log_records if r.levelname == "INFO"]
         self.assertTrue(len(info_records) > 0)
@@ -70,7 +67,7 @@ class TestAuthenticationLogging(unittest.TestCase):
         try:
             raise Exception(error_message)
         except Exception as e:
-            self.logger.error(f"Registration error: {str(e)}", exc_info=True)
+            self.logger.error("Registration error: %s", e, exc_info=True)
         
         error_records = [r for r in self.log_records if r.levelname == "ERROR"]
         self.assertTrue(len(error_records) > 0)
@@ -79,7 +76,7 @@ class TestAuthenticationLogging(unittest.TestCase):
         """Test logging login attempts."""
         username = "testuser"
         self.logger.info("Login attempt")
-        self.logger.info(f"User {username} attempted login")
+        self.logger.info("User %s attempted login", username)
         
         login_records = [r for r in self.log_records if "login" in r.getMessage().lower()]
         self.assertTrue(len(login_records) > 0)
@@ -91,27 +88,15 @@ class TestAuthenticationLogging(unittest.TestCase):
         self.assertIn("successfully", self.log_records[0].getMessage())
 
 
-class TestDatabaseLogging(unittest.TestCase):
+class TestDatabaseLogging(LogCaptureTestCase):
     """Test logging patterns used in database operations."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("app.database.models")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "app.database.models"
     
     def test_save_user_debug_logged(self):
         """Test logging save operation at DEBUG level."""
         username = "newuser"
-        self.logger.debug(f"Saving user: {username}")
+        self.logger.debug("Saving user: %s", username)
         
         debug_records = [r for r in self.log_records if r.levelname == "DEBUG"]
         self.assertTrue(len(debug_records) > 0)
@@ -119,7 +104,7 @@ class TestDatabaseLogging(unittest.TestCase):
     def test_save_user_success_logged(self):
         """Test logging successful user save."""
         username = "newuser"
-        self.logger.info(f"User saved successfully: {username}")
+        self.logger.info("User saved successfully: %s", username)
         
         info_records = [r for r in self.log_records if r.levelname == "INFO"]
         self.assertTrue(len(info_records) > 0)
@@ -134,7 +119,7 @@ class TestDatabaseLogging(unittest.TestCase):
             raise Exception(error_msg)
         except Exception as e:
             self.logger.error(
-                f"Failed to save user {username}: {str(e)}", 
+                "Failed to save user %s: %s", username, e, 
                 exc_info=True
             )
         
@@ -144,7 +129,7 @@ class TestDatabaseLogging(unittest.TestCase):
     def test_find_user_debug_logged(self):
         """Test logging user search at DEBUG level."""
         username = "testuser"
-        self.logger.debug(f"Searching for user: {username}")
+        self.logger.debug("Searching for user: %s", username)
         
         debug_records = [r for r in self.log_records if r.levelname == "DEBUG"]
         self.assertTrue(len(debug_records) > 0)
@@ -152,7 +137,7 @@ class TestDatabaseLogging(unittest.TestCase):
     def test_user_found_logged(self):
         """Test logging when user is found."""
         username = "testuser"
-        self.logger.debug(f"User found: {username}")
+        self.logger.debug("User found: %s", username)
         
         debug_records = [r for r in self.log_records if r.levelname == "DEBUG"]
         self.assertTrue(len(debug_records) > 0)
@@ -161,34 +146,22 @@ class TestDatabaseLogging(unittest.TestCase):
     def test_user_not_found_warning(self):
         """Test logging when user is not found."""
         username = "nonexistent"
-        self.logger.warning(f"User not found: {username}")
+        self.logger.warning("User not found: %s", username)
         
         warning_records = [r for r in self.log_records if r.levelname == "WARNING"]
         self.assertTrue(len(warning_records) > 0)
         self.assertIn("not found", warning_records[0].getMessage().lower())
 
 
-class TestServiceLayerLogging(unittest.TestCase):
+class TestServiceLayerLogging(LogCaptureTestCase):
     """Test logging patterns used in service layer."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("app.fitness.workout_service")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "app.fitness.workout_service"
     
     def test_workout_creation_logged(self):
         """Test logging workout creation."""
         user_id = 1
-        self.logger.info(f"Creating workout for user {user_id}")
+        self.logger.info("Creating workout for user %s", user_id)
         
         info_records = [r for r in self.log_records if r.levelname == "INFO"]
         self.assertTrue(len(info_records) > 0)
@@ -196,7 +169,7 @@ class TestServiceLayerLogging(unittest.TestCase):
     def test_workout_validation_logged(self):
         """Test logging workout validation."""
         workout_type = "cardio"
-        self.logger.debug(f"Validating workout type: {workout_type}")
+        self.logger.debug("Validating workout type: %s", workout_type)
         
         debug_records = [r for r in self.log_records if r.levelname == "DEBUG"]
         self.assertTrue(len(debug_records) > 0)
@@ -204,35 +177,23 @@ class TestServiceLayerLogging(unittest.TestCase):
     def test_workout_saved_logged(self):
         """Test logging saved workout."""
         workout_id = 123
-        self.logger.info(f"Workout saved successfully with ID: {workout_id}")
+        self.logger.info("Workout saved successfully with ID: %s", workout_id)
         
         info_records = [r for r in self.log_records if r.levelname == "INFO"]
         self.assertTrue(len(info_records) > 0)
         self.assertIn("123", info_records[0].getMessage())
 
 
-class TestErrorHandlingPatterns(unittest.TestCase):
+class TestErrorHandlingPatterns(LogCaptureTestCase):
     """Test logging in error handling scenarios."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("app.api.handlers")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "app.api.handlers"
     
     def test_api_request_logged(self):
         """Test logging API requests."""
         endpoint = "/api/users"
         method = "POST"
-        self.logger.info(f"{method} request to {endpoint}")
+        self.logger.info("%s request to %s", method, endpoint)
         
         self.assertIn(endpoint, self.log_records[0].getMessage())
     
@@ -245,7 +206,7 @@ class TestErrorHandlingPatterns(unittest.TestCase):
             raise Exception("Internal server error")
         except Exception as e:
             self.logger.error(
-                f"API request to {endpoint} failed with {error_code}: {str(e)}",
+                "API request to %s failed with %s: %s", endpoint, error_code, e,
                 exc_info=True
             )
         
@@ -256,7 +217,7 @@ class TestErrorHandlingPatterns(unittest.TestCase):
         """Test logging validation errors."""
         field = "email"
         reason = "Invalid format"
-        self.logger.warning(f"Validation failed for {field}: {reason}")
+        self.logger.warning("Validation failed for %s: %s", field, reason)
         
         warning_records = [r for r in self.log_records if r.levelname == "WARNING"]
         self.assertTrue(len(warning_records) > 0)
@@ -266,7 +227,7 @@ class TestErrorHandlingPatterns(unittest.TestCase):
         """Test logging retry operations."""
         attempt = 1
         max_attempts = 3
-        self.logger.debug(f"Retry attempt {attempt} of {max_attempts}")
+        self.logger.debug("Retry attempt %s of %s", attempt, max_attempts)
         
         debug_records = [r for r in self.log_records if r.levelname == "DEBUG"]
         self.assertTrue(len(debug_records) > 0)
@@ -280,22 +241,10 @@ class TestErrorHandlingPatterns(unittest.TestCase):
         self.assertIn("fallback", warning_records[0].getMessage().lower())
 
 
-class TestLoggingBestPractices(unittest.TestCase):
+class TestLoggingBestPractices(LogCaptureTestCase):
     """Test logging best practices."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("app.test.bestpractices")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "app.test.bestpractices"
     
     def test_structured_logging_with_context(self):
         """Test structured logging with contextual information."""
@@ -304,21 +253,23 @@ class TestLoggingBestPractices(unittest.TestCase):
         timestamp = "2026-01-28T14:30:00"
         
         self.logger.info(
-            f"User action: user_id={user_id}, action={action}, timestamp={timestamp}"
+            "User action: user_id=%s, action=%s, timestamp=%s", user_id, action, timestamp
         )
         
-        message = self.log_records[0].getMessage()
-        self.assertIn("user_id=42", message)
-        self.assertIn("action=login", message)
+        match = _CTX_RE.search(self.log_records[0].getMessage())
+        self.assertIsNotNone(match)
+        self.assertEqual(match["uid"], "42")
+        self.assertEqual(match["act"], "login")
+        self.assertEqual(match["ts"], timestamp)
     
     def test_progressive_logging_detail(self):
         """Test logging at different detail levels for operations."""
         operation = "database_query"
         
-        self.logger.debug(f"Starting {operation}")
-        self.logger.debug(f"{operation} - Preparing connection")
-        self.logger.debug(f"{operation} - Executing query")
-        self.logger.info(f"{operation} completed successfully")
+        self.logger.debug("Starting %s", operation)
+        self.logger.debug("%s - Preparing connection", operation)
+        self.logger.debug("%s - Executing query", operation)
+        self.logger.info("%s completed successfully", operation)
         
         debug_count = len([r for r in self.log_records if r.levelname == "DEBUG"])
         info_count = len([r for r in self.log_records if r.levelname == "INFO"])
@@ -331,7 +282,7 @@ class TestLoggingBestPractices(unittest.TestCase):
         # In real code, passwords/tokens should NOT be logged
         # This test ensures we're conscious of security
         username = "testuser"
-        self.logger.info(f"Login attempt for user: {username}")
+        self.logger.info("Login attempt for user: %s", username)
         
         message = self.log_records[0].getMessage()
         # Should have username but not password
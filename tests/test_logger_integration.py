@@ -8,72 +8,70 @@ Tests cover:
 - Real-world usage patterns
 """
 
+import sys
 import unittest
 import logging
 import os
-import sys
 import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import patch
 import time
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
+
+# Run directly as a script: put the project root on sys.path (pytest uses pytest.ini's pythonpath)
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+import app.logger as logger_module
 from app.logger import (
     get_logger,
     setup_logging,
     LOG_DIR,
     LOG_FILE,
 )
+from tests._loghelpers import LogCaptureTestCase
+
+# Logger tests mutate process-wide logging state; keep them on one worker
+pytestmark = pytest.mark.xdist_group("logger_global")
 
 
 class TestLogFileCreation(unittest.TestCase):
     """Test log file creation and management."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root for the whole class."""
+        cls._tmp_root = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._tmp_root.cleanup)
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create temporary directory for test logs
-        self.test_log_dir = tempfile.mkdtemp()
+        # Per-test log directory inside the shared root; not created up front
+        self.test_log_dir = str(Path(self._tmp_root.name) / self._testMethodName)
         self.test_log_file = Path(self.test_log_dir) / "test_app.log"
     
-    def tearDown(self):
-        """Clean up after tests."""
-        # Remove temporary directory and files
-        if self.test_log_dir and os.path.exists(self.test_log_dir):
-            shutil.rmtree(self.test_log_dir)
-    
-    @patch("app.logger.LOG_DIR")
-    @patch("app.logger.LOG_FILE")
-    def test_log_directory_created(self, mock_log_file, mock_log_dir):
-        """Test that log directory is created if it doesn't exist."""
-        mock_log_dir.value = self.test_log_dir
-        mock_log_file.value = self.test_log_file
+    def test_log_directory_created(self):
+        """Test that setup_logging creates the log directory if it doesn't exist."""
+        root_logger = logging.getLogger()
+        self.addCleanup(setattr, root_logger, "handlers", root_logger.handlers.copy())
+        self.addCleanup(root_logger.setLevel, root_logger.level)
+        self.addCleanup(logger_module._stop_listener)
+        self.assertFalse(os.path.exists(self.test_log_dir))
         
-        # Call setup_logging which should create the directory
-        with patch("app.logger.LOG_ENABLED", True):
-            # Directory should exist after setup
-            Path(self.test_log_dir).mkdir(parents=True, exist_ok=True)
-            self.assertTrue(os.path.exists(self.test_log_dir))
+        with patch("app.logger.LOG_ENABLED", True), \
+                patch("app.logger.LOG_DIR", Path(self.test_log_dir)), \
+                patch("app.logger.LOG_FILE", self.test_log_file):
+            setup_logging()
+        
+        self.assertTrue(os.path.isdir(self.test_log_dir))
+        self.assertTrue(self.test_log_file.exists())
 
 
-class TestLoggingMultipleLevels(unittest.TestCase):
+class TestLoggingMultipleLevels(LogCaptureTestCase):
     """Test logging across multiple levels."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("test.multi_level")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
+    logger_name = "test.multi_level"
     
     def test_all_levels_logged(self):
         """Test that all log levels are properly captured."""
@@ -91,65 +89,43 @@ class TestLoggingMultipleLevels(unittest.TestCase):
         self.assertIn("CRITICAL", levels)
 
 
-class TestLoggingWithFormatting(unittest.TestCase):
-    """Test log message formatting."""
+def test_log_with_formatted_string(caplog):
+    """Test logging with formatted strings."""
+    logger = get_logger("test.formatting")
+    user_id = 123
+    username = "testuser"
+    with caplog.at_level(logging.DEBUG, logger="test.formatting"):
+        logger.info(f"User {user_id} ({username}) logged in")
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("test.formatting")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
-    
-    def test_log_with_formatted_string(self):
-        """Test logging with formatted strings."""
-        user_id = 123
-        username = "testuser"
-        self.logger.info(f"User {user_id} ({username}) logged in")
-        
-        message = self.log_records[0].getMessage()
-        self.assertIn("123", message)
-        self.assertIn("testuser", message)
-    
-    def test_log_with_dict_data(self):
-        """Test logging with dictionary data."""
-        data = {"key": "value", "count": 42}
-        self.logger.info(f"Data: {data}")
-        
-        message = self.log_records[0].getMessage()
-        self.assertIn("key", message)
-        self.assertIn("42", message)
+    message = caplog.records[0].getMessage()
+    assert "123" in message
+    assert "testuser" in message
 
 
-class TestDifferentModules(unittest.TestCase):
-    """Test logging in different module contexts."""
-    
-    def test_logger_in_auth_module(self):
-        """Simulate logger usage in auth module."""
-        logger = get_logger("app.auth_module.routes")
-        self.assertEqual(logger.name, "app.auth_module.routes")
-    
-    def test_logger_in_database_module(self):
-        """Simulate logger usage in database module."""
-        logger = get_logger("app.database.models")
-        self.assertEqual(logger.name, "app.database.models")
+def test_log_with_dict_data(caplog):
+    """Test logging with dictionary data."""
+    logger = get_logger("test.formatting")
+    data = {"key": "value", "count": 42}
+    with caplog.at_level(logging.DEBUG, logger="test.formatting"):
+        logger.info(f"Data: {data}")
     
-    def test_logger_in_fitness_module(self):
-        """Simulate logger usage in fitness module."""
-        logger = get_logger("app.fitness.services")
-        self.assertEqual(logger.name, "app.fitness.services")
-    
-    def test_logger_in_chatbot_module(self):
-        """Simulate logger usage in chatbot module."""
-        logger = get_logger("app.chatbot.handler")
-        self.assertEqual(logger.name, "app.chatbot.handler")
+    message = caplog.records[0].getMessage()
+    assert "key" in message
+    assert "42" in message
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "app.auth_module.routes",
+        "app.database.models",
+        "app.fitness.services",
+        "app.chatbot.handler",
+    ],
+)
+def test_logger_name_in_different_modules(name):
+    """Simulate logger usage in auth, database, fitness and chatbot modules."""
+    assert get_logger(name).name == name
 
 
 class TestLoggerMemoization(unittest.TestCase):
@@ -174,93 +150,63 @@ class TestLoggerMemoization(unittest.TestCase):
         self.assertNotEqual(logger1.name, logger2.name)
 
 
-class TestExceptionLogging(unittest.TestCase):
-    """Test logging exceptions properly."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.logger = get_logger("test.exceptions")
-        self.log_records = []
-        
-        self.handler = logging.Handler()
-        self.handler.emit = lambda record: self.log_records.append(record)
-        self.logger.addHandler(self.handler)
-        self.logger.setLevel(logging.DEBUG)
-    
-    def tearDown(self):
-        """Clean up after tests."""
-        self.logger.removeHandler(self.handler)
-    
-    def test_exception_logging(self):
-        """Test logging exceptions with traceback."""
+def test_exception_logging(caplog):
+    """Test logging exceptions with traceback."""
+    logger = get_logger("test.exceptions")
+    with caplog.at_level(logging.DEBUG, logger="test.exceptions"):
         try:
             raise ValueError("Test error")
         except ValueError:
-            self.logger.error("An error occurred", exc_info=True)
-        
-        self.assertEqual(len(self.log_records), 1)
-        self.assertIsNotNone(self.log_records[0].exc_info)
+            logger.error("An error occurred", exc_info=True)
     
-    def test_exception_message_preserved(self):
-        """Test that exception message is preserved in log."""
+    assert len(caplog.records) == 1
+    assert caplog.records[0].exc_info is not None
+
+
+def test_exception_message_preserved(caplog):
+    """Test that exception message is preserved in log."""
+    logger = get_logger("test.exceptions")
+    with caplog.at_level(logging.DEBUG, logger="test.exceptions"):
         try:
             raise RuntimeError("Critical error message")
         except RuntimeError:
-            self.logger.error("Operation failed", exc_info=True)
-        
-        # Check that record has exception info
-        self.assertIsNotNone(self.log_records[0].exc_info)
+            logger.error("Operation failed", exc_info=True)
+    
+    # Check that record has exception info
+    assert caplog.records[0].exc_info is not None
 
 
-class TestLoggerInContexts(unittest.TestCase):
+class TestLoggerInContexts(LogCaptureTestCase):
     """Test logger in different application contexts."""
     
+    logger_name = "test.context"
+    
     def test_logger_in_try_except_block(self):
         """Test logger usage within try-except blocks."""
-        logger = get_logger("test.context")
-        log_records = []
-        
-        handler = logging.Handler()
-        handler.emit = lambda record: log_records.append(record)
-        logger.addHandler(handler)
-        logger.setLevel(logging.DEBUG)
-        
         try:
             # Simulate operation
             result = 10 / 2
-            logger.info(f"Operation successful: {result}")
+            self.logger.info(f"Operation successful: {result}")
         except Exception as e:
-            logger.error(f"Operation failed: {str(e)}", exc_info=True)
+            self.logger.error(f"Operation failed: {str(e)}", exc_info=True)
         finally:
-            logger.debug("Cleaning up")
-        
-        logger.removeHandler(handler)
+            self.logger.debug("Cleaning up")
         
         # Should have logged the success
-        self.assertTrue(any("successful" in r.getMessage() for r in log_records))
+        self.assertTrue(any("successful" in r.getMessage() for r in self.log_records))
     
     def test_logger_in_conditional_blocks(self):
         """Test logger usage with conditional logging."""
-        logger = get_logger("test.conditional")
-        log_records = []
-        
-        handler = logging.Handler()
-        handler.emit = lambda record: log_records.append(record)
-        logger.addHandler(handler)
-        logger.setLevel(logging.DEBUG)
-        
         value = 100
         
         if value > 50:
-            logger.info("Value is high")
+            self.logger.info("Value is high")
         else:
-            logger.info("Value is low")
+            self.logger.info("Value is low")
         
-        logger.removeHandler(handler)
-        
-        self.assertEqual(len(log_records), 1)
-        self.assertIn("high", log_records[0].getMessage())
+        self.assertEqual(len(self.log_records), 1)
+        self.assertIn("high", self.log_records[0].getMessage())
 
 
 if __name__ == "__main__":
-    unittest.main()
+    raise SystemExit(pytest.main([__file__, "-q"]))
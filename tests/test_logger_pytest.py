@@ -12,25 +12,43 @@ import pytest
 
 import app.logger as logger_module
 
+# Logger tests mutate process-wide logging state; keep them on one worker
+pytestmark = pytest.mark.xdist_group("logger_global")
+
+
+@pytest.fixture(scope="session")
+def original_propagate():
+    """Snapshot each existing logger's propagate flag once per session."""
+    return {
+        name: logger.propagate
+        for name, logger in logging.Logger.manager.loggerDict.items()
+        if isinstance(logger, logging.Logger)
+    }
+
 
 @pytest.fixture(autouse=True)
-def reset_logging_state():
+def reset_logging_state(monkeypatch, original_propagate):
     """Reset logging state before and after each test."""
     root_logger = logging.getLogger()
     original_handlers = list(root_logger.handlers)
     original_level = root_logger.level
     original_enabled = logger_module.LOG_ENABLED
     original_level_str = logger_module.LOG_LEVEL
-    original_propagate = {}
 
-    # Store original propagate settings
-    for logger_name in list(logging.Logger.manager.loggerDict.keys()):
-        if isinstance(logging.Logger.manager.loggerDict[logger_name], logging.Logger):
-            original_propagate[logger_name] = logging.Logger.manager.loggerDict[logger_name].propagate
+    # Record which loggers the test asks for; only those can have changed
+    touched = []
+    real_get_logger = logger_module.get_logger
+
+    def tracking_get_logger(name):
+        touched.append(name)
+        return real_get_logger(name)
+
+    monkeypatch.setattr(logger_module, "get_logger", tracking_get_logger)
 
     yield
 
     # Restore original state
+    logger_module._stop_listener()
     root_logger.handlers = []
     for handler in original_handlers:
         root_logger.addHandler(handler)
@@ -38,19 +56,24 @@ def reset_logging_state():
     logger_module.LOG_ENABLED = original_enabled
     logger_module.LOG_LEVEL = original_level_str
     
-    # Restore propagate settings
-    for logger_name, propagate_value in original_propagate.items():
-        if isinstance(logging.Logger.manager.loggerDict[logger_name], logging.Logger):
-            logging.Logger.manager.loggerDict[logger_name].propagate = propagate_value
+    # Restore propagate settings; loggers created during the test get the default
+    for logger_name in touched:
+        logging.getLogger(logger_name).propagate = original_propagate.get(logger_name, True)
 
 
-def test_logging_enable_and_disable(monkeypatch, caplog):
-    """Logging can be enabled and disabled."""
+@pytest.mark.parametrize("use_setup_logging", [False, True])
+def test_logging_enable_and_disable(monkeypatch, caplog, tmp_path, use_setup_logging):
+    """Logging can be enabled and disabled, with or without the full handler setup."""
     monkeypatch.setattr(logger_module, "LOG_ENABLED", True)
     monkeypatch.setattr(logger_module, "LOG_LEVEL", "INFO")
 
-    # Don't call setup_logging() - let pytest's caplog handle it
-    # Just get the logger and use it
+    if use_setup_logging:
+        monkeypatch.setattr(logger_module, "LOG_DIR", tmp_path)
+        monkeypatch.setattr(logger_module, "LOG_FILE", tmp_path / "app.log")
+        logger_module.setup_logging()
+        # setup_logging replaces the root handlers; put caplog's back
+        logging.getLogger().addHandler(caplog.handler)
+
     logger = logger_module.get_logger("test.enable")
     
     # Set level to allow INFO messages
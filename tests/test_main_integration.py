@@ -16,14 +16,30 @@ import app.scaffolding_chat as scaffolding_chat
 from app.database.models import UserProfile
 from app.scaffolding_chat import scaffold_chat_post
 
-
-@pytest.fixture
-def app(monkeypatch):
-    """Create a Flask app with benchmark loader mocked."""
+_PAYLOAD = {
+    "message": "How can I improve my squat?",
+    "profile": {
+        "name": "Avery",
+        "age": 29,
+        "gender": "female",
+        "height": "5'6\"",
+        "weight": "140 lbs",
+        "fitness_goals": ["strength", "mobility"],
+    },
+}
+# Encoded once; every request context reuses the same body
+_PAYLOAD_BYTES = json.dumps(_PAYLOAD).encode()
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Create one Flask app per module with the benchmark loader mocked."""
     benchmarks = {"strength": {"example": 1}}
 
-    monkeypatch.setattr(main_module, "load_fitness_benchmarks", lambda: benchmarks)
-    app = main_module.create_app()
+    # The loader is only called inside create_app, so the patch can end there
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(main_module, "load_fitness_benchmarks", lambda: benchmarks)
+        app = main_module.create_app({"SQLALCHEMY_DATABASE_URI": "sqlite://"})
     app.testing = True
     return app
 
@@ -47,23 +63,11 @@ def test_chat_api_data_flow(monkeypatch, app):
     monkeypatch.setattr(scaffolding_chat, "get_ai_recommendation", fake_ai_call)
     monkeypatch.setattr(scaffolding_chat, "GEMINI_API_KEY", "test-key")
 
-    payload = {
-        "message": "How can I improve my squat?",
-        "profile": {
-            "name": "Avery",
-            "age": 29,
-            "gender": "female",
-            "height": "5'6\"",
-            "weight": "140 lbs",
-            "fitness_goals": ["strength", "mobility"],
-        },
-    }
-
     with app.app_context():
         with app.test_request_context(
             "/",
             method="POST",
-            data=json.dumps(payload),
+            data=_PAYLOAD_BYTES,
             content_type="application/json",
         ):
             response = scaffold_chat_post()
@@ -76,5 +80,22 @@ def test_chat_api_data_flow(monkeypatch, app):
     assert captured["profile"].age == 29
     assert captured["profile"].gender == "female"
     assert captured["profile"].fitness_goals == ["strength", "mobility"]
-    assert captured["message"] == payload["message"]
+    assert captured["message"] == _PAYLOAD["message"]
     assert captured["api_key"] == "test-key"
+
+
+@pytest.mark.parametrize("test_config, expect_setup", [
+    (None, True),
+    ({"SQLALCHEMY_DATABASE_URI": "sqlite://"}, False),
+])
+def test_create_app_sets_up_logging_outside_tests(monkeypatch, tmp_path, test_config, expect_setup):
+    """Production create_app() starts queue logging; test apps leave logging alone."""
+    calls = []
+    monkeypatch.setattr(main_module, "setup_logging", lambda: calls.append(True))
+    monkeypatch.setattr(main_module, "load_fitness_benchmarks", lambda: {})
+    # Keep the default on-disk DB out of the repo's app/instance
+    monkeypatch.setattr(main_module, "project_root", tmp_path)
+
+    main_module.create_app(test_config)
+
+    assert bool(calls) is expect_setup
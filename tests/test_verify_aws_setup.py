@@ -0,0 +1,103 @@
+"""
+Unit tests for scripts/verify_aws_setup.py.
+
+The DynamoDB client is replaced by a stub, so no AWS access is needed.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import scripts.verify_aws_setup as verify
+from app.dynamodb_module import USER_PROFILES_TABLE, HEALTH_DATA_TABLE
+
+
+class _StubClient:
+    """Minimal DynamoDB client recording which API calls were made."""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls = []
+
+    def describe_table(self, TableName):
+        self.calls.append("DescribeTable")
+        if TableName not in self.tables:
+            raise RuntimeError(f"Requested resource not found: {TableName}")
+        return {"Table": {"TableStatus": "ACTIVE", "ItemCount": 3}}
+
+    def get_paginator(self, operation_name):
+        assert operation_name == "list_tables"
+        self.calls.append("ListTables")
+        return SimpleNamespace(paginate=lambda **kwargs: [{"TableNames": list(self.tables)}])
+
+
+@pytest.fixture
+def stub_client(monkeypatch):
+    """Install a stub client that has both tables; tests may drop some."""
+    client = _StubClient({USER_PROFILES_TABLE, HEALTH_DATA_TABLE})
+    monkeypatch.setattr(verify, "_get_dynamodb_client", lambda: client)
+    return client
+
+
+def test_default_check_only_describes_tables(stub_client, capsys):
+    """Default path makes one DescribeTable per table and no ListTables call."""
+    assert verify.check_dynamodb_connection() is True
+
+    assert stub_client.calls == ["DescribeTable", "DescribeTable"]
+    out = capsys.readouterr().out
+    assert f"Connected to '{USER_PROFILES_TABLE}' table" in out
+    assert "Item count: 3" in out
+
+
+def test_default_check_reports_missing_table(stub_client, capsys):
+    """A failed DescribeTable is reported per table, not as a connection error."""
+    stub_client.tables.discard(HEALTH_DATA_TABLE)
+
+    assert verify.check_dynamodb_connection() is False
+
+    assert "ListTables" not in stub_client.calls
+    out = capsys.readouterr().out
+    assert f"Error accessing '{HEALTH_DATA_TABLE}' table" in out
+    assert "Error connecting to DynamoDB" not in out
+
+
+def test_fast_check_only_lists_tables(stub_client, capsys):
+    """--fast makes a single ListTables call."""
+    assert verify.check_dynamodb_connection(fast=True) is True
+
+    assert stub_client.calls == ["ListTables"]
+    assert f"Found '{HEALTH_DATA_TABLE}' table" in capsys.readouterr().out
+
+
+def test_fast_check_reports_missing_table(stub_client, capsys):
+    """--fast fails when a table is absent from ListTables."""
+    stub_client.tables.discard(USER_PROFILES_TABLE)
+
+    assert verify.check_dynamodb_connection(fast=True) is False
+
+    assert f"'{USER_PROFILES_TABLE}' table: table not found" in capsys.readouterr().out
+
+
+@pytest.fixture
+def env_checks_pass(monkeypatch):
+    """Skip the .env checks so main() reaches the DynamoDB check."""
+    monkeypatch.setattr(verify, "check_env_file", lambda: True)
+    monkeypatch.setattr(verify, "check_env_variables", lambda: True)
+
+
+def test_main_fast_passes(stub_client, env_checks_pass, capsys):
+    """main(['--fast']) passes with both tables present."""
+    verify.main(["--fast"])
+
+    assert stub_client.calls == ["ListTables"]
+    assert "All checks passed" in capsys.readouterr().out
+
+
+def test_main_fast_exits_nonzero_on_missing_table(stub_client, env_checks_pass, capsys):
+    """main(['--fast']) exits 1 when tables are missing."""
+    stub_client.tables.clear()
+
+    with pytest.raises(SystemExit) as excinfo:
+        verify.main(["--fast"])
+
+    assert excinfo.value.code == 1
+    assert "❌ FAIL: DynamoDB Connection" in capsys.readouterr().out
@@ -6,37 +6,58 @@ Dummy upload script stub for manual test documentation.
 
 from __future__ import annotations
 
+# argparse stays here for the parse_args annotation; other imports live inside
+# the functions that use them, and requests is only imported for a real upload.
 import argparse
-import os
-import sys
-import time
-from pathlib import Path
 
 
-def parse_args() -> argparse.Namespace:
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    import os
+
     p = argparse.ArgumentParser(description="Upload a workout video to the backend (stub).")
     p.add_argument("--file", required=True, help="Path to the video file (e.g., bicep_curl_user_10s.mp4)")
     p.add_argument("--exercise", required=True, help="Exercise label (e.g., bicep_curl)")
     p.add_argument("--endpoint", default=os.environ.get("AGFC_UPLOAD_ENDPOINT", ""), help="Upload URL endpoint")
     p.add_argument("--token", default=os.environ.get("AGFC_AUTH_TOKEN", ""), help="Bearer token (optional)")
     p.add_argument("--timeout", type=int, default=30, help="HTTP timeout seconds (default 30)")
+    p.add_argument("--repeat", type=positive_int, default=1, help="Upload the file N times over one session (default 1)")
     p.add_argument("--dry-run", action="store_true", help="Do not perform network request; print actions only")
-    return p.parse_args()
+    return p.parse_args(argv)
 
 
 def human_size(num_bytes: int) -> str:
-    units = ["B", "KB", "MB", "GB"]
-    size = float(num_bytes)
-    for u in units:
-        if size < 1024.0 or u == units[-1]:
-            return f"{size:.2f}{u}"
-        size /= 1024.0
-    return f"{num_bytes}B"
-
-
-def main() -> int:
-    args = parse_args()
-    video_path = Path(args.file)
+    if num_bytes <= 0:
+        return "0.00B"
+    units = ("B", "KB", "MB", "GB")
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    idx = min((num_bytes.bit_length() - 1) // 10, len(units) - 1)
+    return f"{num_bytes / (1 << (idx * 10)):.2f}{units[idx]}"
+
+
+def upload(
+    file: str,
+    exercise: str,
+    endpoint: str = "",
+    token: str = "",
+    timeout: int = 30,
+    dry_run: bool = False,
+    repeat: int = 1,
+) -> int:
+    """Upload ``file`` to ``endpoint`` and return a process exit code."""
+    if repeat < 1:
+        raise ValueError("repeat must be a positive integer")
+    import time
+    from pathlib import Path
+
+    video_path = Path(file)
 
     if not video_path.exists() or not video_path.is_file():
         print(f"[FAIL] File not found: {video_path}")
@@ -45,14 +66,14 @@ def main() -> int:
     file_size = video_path.stat().st_size
 
     # Decide whether we can do a real request
-    can_attempt_http = bool(args.endpoint) and not args.dry_run
+    can_attempt_http = bool(endpoint) and not dry_run
 
     print("=== AI Gym Feedback Companion — Upload Script (Stub) ===")
     print(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"File: {video_path} ({human_size(file_size)})")
-    print(f"Exercise: {args.exercise}")
-    print(f"Endpoint: {args.endpoint if args.endpoint else '(not set)'}")
-    print(f"Auth token: {'(provided)' if args.token else '(none)'}")
+    print(f"Exercise: {exercise}")
+    print(f"Endpoint: {endpoint if endpoint else '(not set)'}")
+    print(f"Auth token: {'(provided)' if token else '(none)'}")
     print(f"Mode: {'HTTP UPLOAD' if can_attempt_http else 'DRY RUN'}")
     print("--------------------------------------------------------")
 
@@ -75,37 +96,51 @@ def main() -> int:
         print("       Or rerun with --dry-run.")
         return 3
 
-    headers = {}
-    if args.token:
-        headers["Authorization"] = f"Bearer {args.token}"
-
-    files = {
-        "file": (video_path.name, open(video_path, "rb"), "video/mp4"),
-    }
-    data = {
-        "exercise": args.exercise,
-    }
-
     try:
-        resp = requests.post(
-            args.endpoint,
-            headers=headers,
-            data=data,
-            files=files,
-            timeout=args.timeout,
-        )
-    finally:
-        # Ensure file handle closed
-        try:
-            files["file"][1].close()
-        except Exception:
-            pass
-
-    print(f"HTTP status: {resp.status_code}")
-    body_preview = resp.text[:500].replace("\n", "\\n")
-    print(f"Response (first 500 chars): {body_preview}")
-
-    if 200 <= resp.status_code < 300:
+        from requests_toolbelt import MultipartEncoder  # type: ignore
+    except ImportError:
+        MultipartEncoder = None
+
+    # A Session keeps the connection alive across --repeat uploads
+    with requests.Session() as session:
+        session.headers["Connection"] = "keep-alive"
+        if token:
+            session.headers["Authorization"] = f"Bearer {token}"
+
+        failures = 0
+        for attempt in range(1, repeat + 1):
+            with video_path.open("rb") as fh:
+                if MultipartEncoder is not None:
+                    # Stream the multipart body instead of building it in memory
+                    encoder = MultipartEncoder(
+                        fields={
+                            "exercise": exercise,
+                            "file": (video_path.name, fh, "video/mp4"),
+                        }
+                    )
+                    resp = session.post(
+                        endpoint,
+                        headers={"Content-Type": encoder.content_type},
+                        data=encoder,
+                        timeout=timeout,
+                    )
+                else:
+                    resp = session.post(
+                        endpoint,
+                        data={"exercise": exercise},
+                        files={"file": (video_path.name, fh, "video/mp4")},
+                        timeout=timeout,
+                    )
+
+            if repeat > 1:
+                print(f"--- Upload {attempt}/{repeat} ---")
+            print(f"HTTP status: {resp.status_code}")
+            body_preview = resp.text[:500].replace("\n", "\\n")
+            print(f"Response (first 500 chars): {body_preview}")
+            if not 200 <= resp.status_code < 300:
+                failures += 1
+
+    if not failures:
         print("[PASS] Upload succeeded.")
         return 0
 
@@ -113,5 +148,18 @@ def main() -> int:
     return 4
 
 
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    return upload(
+        args.file,
+        args.exercise,
+        endpoint=args.endpoint,
+        token=args.token,
+        timeout=args.timeout,
+        dry_run=args.dry_run,
+        repeat=args.repeat,
+    )
+
+
 if __name__ == "__main__":
     raise SystemExit(main())